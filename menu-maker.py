@@ -5,11 +5,17 @@ Features: Categories, Info display, Collapse/Expand, Theme selection
 """
 
 import os
-import subprocess
+import re
+import sys
 import json
-import copy
-from typing import Dict, List, Any, Optional, Tuple
+import errno
+import shutil
+import stat
+import functools
+import threading
+from typing import Dict, List, Any, Optional, Set, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
 from textual.app import App, ComposeResult
 from textual.containers import Vertical, Horizontal, Container, ScrollableContainer
@@ -17,53 +23,216 @@ from textual.widgets import Header, Footer, Static, Button, Input, Label, TextAr
 from textual.binding import Binding
 from textual.screen import Screen
 from textual.reactive import reactive
-from textual.events import Click
+from textual.events import Click, Resize
+from textual.message import Message
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-DEFAULT_COLOR_PAIRS = [
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data as compact JSON bytes."""
+        return orjson.dumps(data)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data as compact JSON bytes."""
+        # json only uses its C encoder when no indent is requested
+        return json.dumps(data, separators=(",", ":")).encode()
+
+
+DEFAULT_COLOR_PAIRS = tuple(MappingProxyType(pair) for pair in (
     {"name": "Teal Glow", "background": "#034e68", "text": "#caf0f8"},
     {"name": "Amber Pop", "background": "#6f1d1b", "text": "#ffe5d9"},
     {"name": "Purple Mist", "background": "#240046", "text": "#f8f9fa"},
     {"name": "Forest Tones", "background": "#283618", "text": "#fefae0"},
     {"name": "Slate Shine", "background": "#2b2d42", "text": "#edf2f4"},
-]
+))
+
+# Lowercased (background, text) keys for DEFAULT_COLOR_PAIRS, used for palette dedup
+_DEFAULT_PAIR_KEYS = tuple((pair["background"].lower(), pair["text"].lower()) for pair in DEFAULT_COLOR_PAIRS)
+
+
+_THEMES_RAW = {
+    "classic": {
+        "name": "Classic Teal",
+        "primary": "#00b4d8",
+        "accent": "#00f5ff", 
+        "bg": "#034e68",
+        "surface": "#023047",
+        "text": "#caf0f8"
+    },
+    "nord": {
+        "name": "Nord Theme",
+        "primary": "#5e81ac",
+        "accent": "#88c0d0",
+        "bg": "#2e3440",
+        "surface": "#3b4252",
+        "text": "#eceff4"
+    },
+    "gruvbox": {
+        "name": "Gruvbox Dark",
+        "primary": "#d79921",
+        "accent": "#fabd2f",
+        "bg": "#282828",
+        "surface": "#3c3836",
+        "text": "#fbf1c7"
+    },
+    "dracula": {
+        "name": "Dracula",
+        "primary": "#bd93f9",
+        "accent": "#ff79c6",
+        "bg": "#282a36",
+        "surface": "#44475a",
+        "text": "#f8f8f2"
+    },
+    "monokai": {
+        "name": "Monokai",
+        "primary": "#a6e22e",
+        "accent": "#f92672",
+        "bg": "#272822",
+        "surface": "#383830",
+        "text": "#f8f8f2"
+    }
+}
+
+THEMES = MappingProxyType({key: MappingProxyType(theme) for key, theme in _THEMES_RAW.items()})
+_THEME_KEYS = tuple(_THEMES_RAW.keys())
+
+_HEX6 = re.compile(r"[0-9a-f]{6}")
+
+# Buffer size for config file reads/writes
+_IO_BUFFER_SIZE = 65536
+# Delay before a requested menus.json save runs, so bursts coalesce into one
+_SAVE_DELAY_SECONDS = 0.25
 
 
 def normalize_hex_color(value: Optional[str]) -> Optional[str]:
     """Normalize a hex color string to #RRGGBB."""
     if not value or not isinstance(value, str):
         return None
+    return _normalize_hex_cached(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_hex_cached(value: str) -> Optional[str]:
+    """Cached worker for normalize_hex_color; expects a non-empty str."""
     color = value.strip().lower()
     if not color:
         return None
     if not color.startswith("#"):
         color = f"#{color}"
-    if len(color) != 7:
-        return None
-    try:
-        int(color[1:], 16)
-    except ValueError:
-        return None
-    return color
+    if len(color) == 7 and _HEX6.fullmatch(color, 1) is not None:
+        return color
+    return None
 
 
 def sanitize_color_pair(color_pair: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
     """Validate and normalize a color pair dict."""
     if not color_pair or not isinstance(color_pair, dict):
         return None
-    background = normalize_hex_color(color_pair.get("background"))
-    text = normalize_hex_color(color_pair.get("text"))
+    background = color_pair.get("background")
+    text = color_pair.get("text")
+    if not isinstance(background, str) or not isinstance(text, str):
+        return None
+    pair = _sanitize_pair_cached(background, text)
+    if pair:
+        # Hand out a fresh dict since callers store and mutate the result
+        return {"background": pair[0], "text": pair[1]}
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_pair_cached(background: str, text: str) -> Optional[Tuple[str, str]]:
+    """Cached worker for sanitize_color_pair keyed on the raw strings."""
+    background = normalize_hex_color(background)
+    text = normalize_hex_color(text)
     if background and text:
-        return {"background": background, "text": text}
+        return background, text
     return None
 
 
+def _parse_int(value: Optional[str], default: int) -> int:
+    """Parse a non-negative integer string, returning default if it isn't one."""
+    value = (value or "").strip()
+    return int(value) if value.isdecimal() else default
+
+
+def _clone_json(value: Any) -> Any:
+    """Copy parsed JSON data; much cheaper than copy.deepcopy for plain dicts/lists."""
+    if isinstance(value, dict):
+        return {key: _clone_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_json(item) for item in value]
+    return value
+
+
+def _intern_categories(categories: Dict[str, Any]) -> Dict[str, Any]:
+    """Return categories keyed by interned names, with item categories interned to match."""
+    interned = {}
+    for name, category_data in categories.items():
+        for item in category_data.get('items', []):
+            category = item.get('category')
+            if isinstance(category, str):
+                item['category'] = sys.intern(category)
+        interned[sys.intern(name)] = category_data
+    return interned
+
+
+def _default_custom_colors() -> List[Dict[str, str]]:
+    """Return fresh, mutable copies of the default color pairs."""
+    return [dict(pair) for pair in DEFAULT_COLOR_PAIRS]
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_config_dir() -> Path:
+    """Create ~/.local/menu-maker once per process and return it."""
+    config_dir = Path.home() / ".local" / "menu-maker"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
+
+@functools.lru_cache(maxsize=1)
+def _system_name() -> str:
+    """Return the OS name from uname; it cannot change within a process."""
+    return os.uname().sysname
+
+
+# Terminal detection rules in priority order: (environment variable, substring, terminal type)
+_TERM_TABLE = (
+    ("TERM", "xterm", "xterm"),
+    ("TERM_PROGRAM", "gnome", "xterm"),
+    ("TERM", "screen", "screen"),
+    ("TERM", "tmux", "tmux"),
+    ("TERM", "linux", "linux_console"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _terminal_type() -> str:
+    """Return the terminal type from the environment; looked up once per process."""
+    env = {
+        "TERM": os.environ.get('TERM', '').lower(),
+        "TERM_PROGRAM": os.environ.get('TERM_PROGRAM', '').lower()
+    }
+    for var, needle, terminal in _TERM_TABLE:
+        if needle in env[var]:
+            return terminal
+    return 'unknown'
+
+
 class InfoScreen(Screen):
     """Screen for displaying app information."""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape,i,enter", "close", "Close"),
-    ]
+    )
     
     def __init__(self, item_data: Dict[str, str]):
         super().__init__()
@@ -96,10 +265,10 @@ class InfoScreen(Screen):
 class EditTitleScreen(Screen):
     """Screen for editing the application title."""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel"),
         Binding("ctrl+s", "save", "Save"),
-    ]
+    )
     
     def __init__(self, current_title: str):
         super().__init__()
@@ -142,10 +311,10 @@ class EditTitleScreen(Screen):
 class EditCategoryScreen(Screen):
     """Screen for editing category names and colors."""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel"),
         Binding("ctrl+s", "save", "Save"),
-    ]
+    )
     
     def __init__(
         self,
@@ -159,71 +328,92 @@ class EditCategoryScreen(Screen):
         super().__init__()
         self.old_category_name = old_category_name
         self.category_colors = sanitize_color_pair(category_colors) or {}
-        self.available_colors = copy.deepcopy(available_colors) if available_colors else []
+        self.available_colors = [dict(color) for color in available_colors] if available_colors else []
         self.existing_categories = existing_categories
-        self.palette_render_id = 0
+        self._existing_set = {name for name in existing_categories if name != old_category_name}
+        self._error_is_set = False
         self.max_columns = max(1, max_columns)
         self.category_column = max(1, min(self.max_columns, current_column or 1))
         self.current_palette: List[Dict[str, str]] = []
+        # Last rendered palette, used to diff against on refresh
+        self._mounted_palette: List[Tuple[Button, Dict[str, str]]] = []
+        self._palette_button_index: Dict[str, int] = {}
+        # Bumped whenever available_colors changes; the palette is rebuilt only then
+        self._palette_available_version = 0
+        self._palette_cache: Optional[List[Dict[str, str]]] = None
+        self._palette_cache_version = -1
     
     def compose(self) -> ComposeResult:
         """Create category edit screen layout."""
-        with Container(classes="edit-container"):
-            yield Label("Edit Category", classes="edit-title")
-            
-            yield Label("Category Name:")
-            yield Input(value=self.old_category_name, id="category_input")
-            
-            yield Label(f"Column (1-{self.max_columns}):")
-            yield Input(value=str(self.category_column), id="column_input", placeholder="1")
-            
-            yield Label("Color Presets (click to use):")
-            with ScrollableContainer(classes="color-palette", id="palette_container"):
-                palette_entries = self._build_palette_entries()
-                self.palette_render_id += 1
-                for idx, color in enumerate(palette_entries):
-                    name = color.get("name") or f"Color {idx + 1}"
-                    preview = f"{color.get('background', '')} / {color.get('text', '')}"
-                    button_id = self._make_palette_button_id(idx)
-                    yield self.create_color_button(button_id, name, preview, color)
-            
-            yield Label("Custom Color Name (optional):")
-            yield Input(id="color_name_input", placeholder="e.g. Sunset")
-            
-            yield Label("Background Color (#RRGGBB):")
-            yield Input(value=self.category_colors.get("background", ""), id="background_input", placeholder="#123456")
-            
-            yield Label("Text Color (#RRGGBB):")
-            yield Input(value=self.category_colors.get("text", ""), id="text_input", placeholder="#ffffff")
-            
-            with Horizontal(classes="button-row"):
-                yield Button("Add Custom Color", id="add_color")
-            
-            yield Label("", id="color_error", classes="error-message")
-            
-            with Horizontal(classes="button-row"):
-                yield Button("Save", id="save", variant="primary")
-                yield Button("Cancel", id="cancel")
+        # Keep direct references to the widgets used by the save/validate paths
+        self._category_input = Input(value=self.old_category_name, id="category_input")
+        self._column_input = Input(value=str(self.category_column), id="column_input", placeholder="1")
+        self._color_name_input = Input(id="color_name_input", placeholder="e.g. Sunset")
+        self._background_input = Input(value=self.category_colors.get("background", ""), id="background_input", placeholder="#123456")
+        self._text_input = Input(value=self.category_colors.get("text", ""), id="text_input", placeholder="#ffffff")
+        self._color_error = Label("", id="color_error", classes="error-message")
+        
+        for idx, color in enumerate(self._build_palette_entries()):
+            self._mounted_palette.append((self.make_palette_button(idx, color), color))
+        self._palette_container = ScrollableContainer(
+            *(button for button, _ in self._mounted_palette),
+            classes="color-palette",
+            id="palette_container"
+        )
+        
+        # Build the whole subtree up front so it is attached in one mount
+        yield Container(
+            Label("Edit Category", classes="edit-title"),
+            Label("Category Name:"),
+            self._category_input,
+            Label(f"Column (1-{self.max_columns}):"),
+            self._column_input,
+            Label("Color Presets (click to use):"),
+            self._palette_container,
+            Label("Custom Color Name (optional):"),
+            self._color_name_input,
+            Label("Background Color (#RRGGBB):"),
+            self._background_input,
+            Label("Text Color (#RRGGBB):"),
+            self._text_input,
+            Horizontal(Button("Add Custom Color", id="add_color"), classes="button-row"),
+            self._color_error,
+            Horizontal(
+                Button("Save", id="save", variant="primary"),
+                Button("Cancel", id="cancel"),
+                classes="button-row"
+            ),
+            classes="edit-container"
+        )
 
     def _make_palette_button_id(self, idx: int) -> str:
-        """Return a unique id for palette buttons."""
-        return f"color_{self.palette_render_id}_{idx}"
+        """Return a stable id for palette buttons."""
+        return f"color_{idx}"
+
+    def _make_palette_label(self, idx: int, color: Dict[str, str]) -> Tuple[str, str]:
+        """Return the display name and preview text for a palette entry."""
+        name = color.get("name") or f"Color {idx + 1}"
+        preview = f"{color.get('background', '')} / {color.get('text', '')}"
+        return name, preview
 
     def _build_palette_entries(self) -> List[Dict[str, str]]:
         """Build palette list ensuring a minimum number of entries."""
-        palette = [color.copy() for color in self.available_colors]
+        if self._palette_cache is not None and self._palette_cache_version == self._palette_available_version:
+            self.current_palette = self._palette_cache
+            return self._palette_cache
+        
+        # Validate once here so every entry has usable background/text colors
+        palette = []
         seen_pairs = set()
-        for color in palette:
-            bg = color.get("background")
-            text = color.get("text")
-            if bg and text:
-                seen_pairs.add((bg.lower(), text.lower()))
-        for default in DEFAULT_COLOR_PAIRS:
-            bg = default.get("background")
-            text = default.get("text")
-            if not bg or not text:
+        for color in self.available_colors:
+            pair = sanitize_color_pair(color)
+            if not pair:
                 continue
-            pair = (bg.lower(), text.lower())
+            entry = dict(color)
+            entry.update(pair)
+            palette.append(entry)
+            seen_pairs.add((pair["background"], pair["text"]))
+        for default, pair in zip(DEFAULT_COLOR_PAIRS, _DEFAULT_PAIR_KEYS):
             if pair not in seen_pairs:
                 palette.append(default.copy())
                 seen_pairs.add(pair)
@@ -236,19 +426,27 @@ class EditCategoryScreen(Screen):
                 "text": "#caf0f8"
             })
         self.current_palette = palette
+        self._palette_cache = palette
+        self._palette_cache_version = self._palette_available_version
         return palette
 
+    def make_palette_button(self, idx: int, color: Dict[str, str]) -> Button:
+        """Create the button for the palette entry at idx."""
+        name, preview = self._make_palette_label(idx, color)
+        button_id = self._make_palette_button_id(idx)
+        self._palette_button_index[button_id] = idx
+        return self.create_color_button(button_id, name, preview, color)
+
     def create_color_button(self, button_id: str, name: str, preview: str, color: Dict[str, str]) -> Button:
         """Create a color preset button styled with its colors."""
         button = Button(f"{name} — {preview}", id=button_id, classes="color-button")
-        try:
-            if color.get("background"):
-                button.styles.background = color["background"]
-            if color.get("text"):
-                button.styles.color = color["text"]
-        except Exception:
-            pass
+        self.apply_color_styles(button, color)
         return button
+
+    def apply_color_styles(self, button: Button, color: Dict[str, str]) -> None:
+        """Style a palette button with its (already validated) color pair."""
+        button.styles.background = color["background"]
+        button.styles.color = color["text"]
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -264,15 +462,14 @@ class EditCategoryScreen(Screen):
     
     def action_add_color(self) -> None:
         """Add the current inputs as a saved color pair."""
-        background = normalize_hex_color(self.query_one("#background_input", Input).value)
-        text = normalize_hex_color(self.query_one("#text_input", Input).value)
+        background = normalize_hex_color(self._background_input.value)
+        text = normalize_hex_color(self._text_input.value)
         
         if not background or not text:
             self.show_error("Enter valid background and text colors (e.g. #1a2b3c).")
             return
         
-        name_input = self.query_one("#color_name_input", Input)
-        name = name_input.value.strip() or f"Custom {len(self.available_colors) + 1}"
+        name = self._color_name_input.value.strip() or f"Custom {len(self.available_colors) + 1}"
         
         # Update if the pair already exists, otherwise append
         for color in self.available_colors:
@@ -285,63 +482,69 @@ class EditCategoryScreen(Screen):
                 "background": background,
                 "text": text
             })
+        self._palette_available_version += 1
         
-        self.clear_error()
-        self.refresh_color_palette()
+        # Coalesce the error label update and palette changes into one render
+        with self.app.batch_update():
+            self.clear_error()
+            self.refresh_color_palette()
     
     def apply_palette_choice(self, button_id: str) -> None:
         """Apply a selected preset color to the input fields."""
-        try:
-            idx = int(button_id.split("_")[-1])
-            palette = self.current_palette or self._build_palette_entries()
-            color = palette[idx]
-        except (ValueError, IndexError):
+        idx = self._palette_button_index.get(button_id)
+        palette = self.current_palette or self._build_palette_entries()
+        if idx is None or idx >= len(palette):
             return
+        color = palette[idx]
         
-        background_input = self.query_one("#background_input", Input)
-        text_input = self.query_one("#text_input", Input)
-        background_input.value = color.get("background", "")
-        text_input.value = color.get("text", "")
+        self._background_input.value = color.get("background", "")
+        self._text_input.value = color.get("text", "")
         self.clear_error()
     
     def refresh_color_palette(self) -> None:
         """Refresh the preset color list."""
-        try:
-            container = self.query_one("#palette_container", ScrollableContainer)
-        except Exception:
+        container = self._palette_container
+        if not container.is_mounted:
             return
         
-        container.remove_children()
-        self.palette_render_id += 1
+        # Diff against the rendered palette so only changed entries are touched
         palette_entries = self._build_palette_entries()
+        mounted = self._mounted_palette
         for idx, color in enumerate(palette_entries):
-            name = color.get("name") or f"Color {idx + 1}"
-            preview = f"{color.get('background', '')} / {color.get('text', '')}"
-            button_id = self._make_palette_button_id(idx)
-            button = self.create_color_button(button_id, name, preview, color)
-            container.mount(button)
+            if idx >= len(mounted):
+                button = self.make_palette_button(idx, color)
+                container.mount(button)
+                mounted.append((button, color))
+                continue
+            button, previous = mounted[idx]
+            if previous == color:
+                continue
+            name, preview = self._make_palette_label(idx, color)
+            button.label = f"{name} — {preview}"
+            if (previous.get("background"), previous.get("text")) != (color.get("background"), color.get("text")):
+                self.apply_color_styles(button, color)
+            mounted[idx] = (button, color)
+        for button, _ in mounted[len(palette_entries):]:
+            self._palette_button_index.pop(button.id, None)
+            button.remove()
+        del mounted[len(palette_entries):]
     
     def action_save(self) -> None:
         """Save the category settings."""
-        category_input = self.query_one("#category_input", Input)
-        new_name = category_input.value.strip()
-        background_input = self.query_one("#background_input", Input)
-        text_input = self.query_one("#text_input", Input)
-        column_input = self.query_one("#column_input", Input)
+        new_name = self._category_input.value.strip()
         
         if not new_name:
             self.show_error("Category name is required.")
             return
         
-        normalized_background = normalize_hex_color(background_input.value)
-        normalized_text = normalize_hex_color(text_input.value)
+        normalized_background = normalize_hex_color(self._background_input.value)
+        normalized_text = normalize_hex_color(self._text_input.value)
         
         if (normalized_background and not normalized_text) or (normalized_text and not normalized_background):
             self.show_error("Provide both background and text colors or leave both blank.")
             return
         
-        if (new_name != self.old_category_name and 
-            new_name in [name for name in self.existing_categories if name != self.old_category_name]):
+        if new_name != self.old_category_name and new_name in self._existing_set:
             self.show_error("Another category already uses that name.")
             return
         
@@ -352,37 +555,30 @@ class EditCategoryScreen(Screen):
                 "text": normalized_text
             }
         
-        try:
-            column_value = int(column_input.value.strip())
-        except (ValueError, AttributeError):
-            column_value = self.category_column
+        column_value = _parse_int(self._column_input.value, self.category_column)
         column_value = max(1, min(self.max_columns, column_value))
         
-        self.clear_error()
+        # No need to clear the error label; the screen is dismissed
         self.dismiss({
             "action": "save",
             "old_name": self.old_category_name,
             "new_name": new_name,
             "colors": colors,
             "column": column_value,
-            "custom_colors": copy.deepcopy(self.available_colors)
+            "custom_colors": [dict(color) for color in self.available_colors]
         })
     
     def show_error(self, message: str) -> None:
         """Display an error message."""
-        try:
-            error_label = self.query_one("#color_error", Label)
-            error_label.update(message)
-        except Exception:
-            pass
+        self._color_error.update(message)
+        self._error_is_set = True
     
     def clear_error(self) -> None:
         """Clear the error message."""
-        try:
-            error_label = self.query_one("#color_error", Label)
-            error_label.update("")
-        except Exception:
-            pass
+        if not self._error_is_set:
+            return
+        self._color_error.update("")
+        self._error_is_set = False
     
     def action_cancel(self) -> None:
         """Cancel editing."""
@@ -392,10 +588,10 @@ class EditCategoryScreen(Screen):
 class EditItemScreen(Screen):
     """Screen for editing menu items with all fields."""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel"),
         Binding("ctrl+s", "save", "Save"),
-    ]
+    )
     
     def __init__(self, item_data: Dict[str, str], categories: List[str], item_index: int = -1):
         super().__init__()
@@ -469,55 +665,14 @@ class EditItemScreen(Screen):
 class SettingsScreen(Screen):
     """Screen for managing application settings."""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel"),
         Binding("enter", "apply", "Apply"),
         Binding("up", "cursor_up", "Up"),
         Binding("down", "cursor_down", "Down"),
-    ]
-    
-    THEMES = {
-        "classic": {
-            "name": "Classic Teal",
-            "primary": "#00b4d8",
-            "accent": "#00f5ff", 
-            "bg": "#034e68",
-            "surface": "#023047",
-            "text": "#caf0f8"
-        },
-        "nord": {
-            "name": "Nord Theme",
-            "primary": "#5e81ac",
-            "accent": "#88c0d0",
-            "bg": "#2e3440",
-            "surface": "#3b4252",
-            "text": "#eceff4"
-        },
-        "gruvbox": {
-            "name": "Gruvbox Dark",
-            "primary": "#d79921",
-            "accent": "#fabd2f",
-            "bg": "#282828",
-            "surface": "#3c3836",
-            "text": "#fbf1c7"
-        },
-        "dracula": {
-            "name": "Dracula",
-            "primary": "#bd93f9",
-            "accent": "#ff79c6",
-            "bg": "#282a36",
-            "surface": "#44475a",
-            "text": "#f8f8f2"
-        },
-        "monokai": {
-            "name": "Monokai",
-            "primary": "#a6e22e",
-            "accent": "#f92672",
-            "bg": "#272822",
-            "surface": "#383830",
-            "text": "#f8f8f2"
-        }
-    }
+    )
+    
+    THEMES = THEMES
     
     MAX_COLUMNS = 6
     
@@ -526,10 +681,15 @@ class SettingsScreen(Screen):
         self.current_title = current_title
         self.current_theme = current_theme
         self.selected_index = 0
-        self.theme_keys = list(self.THEMES.keys())
+        self.theme_keys = _THEME_KEYS
         self.column_count = max(1, min(self.MAX_COLUMNS, columns))
         if current_theme in self.theme_keys:
             self.selected_index = self.theme_keys.index(current_theme)
+        # Pre-rendered label text for each theme row
+        self._theme_labels_selected = [f"▶ {theme['name']}" for theme in self.THEMES.values()]
+        self._theme_labels_unselected = [f"  {theme['name']}" for theme in self.THEMES.values()]
+        self._theme_labels: List[Label] = []
+        self._prev_selected = self.selected_index
     
     def compose(self) -> ComposeResult:
         """Create settings screen layout."""
@@ -539,9 +699,11 @@ class SettingsScreen(Screen):
             yield Label("Choose Theme:")
             
             with Container():
-                for i, (theme_key, theme_data) in enumerate(self.THEMES.items()):
-                    selected_marker = "▶ " if i == self.selected_index else "  "
-                    yield Label(f"{selected_marker}{theme_data['name']}", id=f"theme_{i}")
+                for i in range(len(self.theme_keys)):
+                    labels = self._theme_labels_selected if i == self.selected_index else self._theme_labels_unselected
+                    label = Label(labels[i], id=f"theme_{i}")
+                    self._theme_labels.append(label)
+                    yield label
             
             yield Label(f"Columns (1-{self.MAX_COLUMNS}):", id="columns_label")
             yield Input(value=str(self.column_count), id="columns_input", placeholder="1")
@@ -584,12 +746,12 @@ class SettingsScreen(Screen):
         self.dismiss({"action": "cancel"})
     
     def update_selection(self) -> None:
-        """Update visual selection."""
-        for i, theme_key in enumerate(self.theme_keys):
-            label = self.query_one(f"#theme_{i}", Label)
-            theme_data = self.THEMES[theme_key]
-            selected_marker = "▶ " if i == self.selected_index else "  "
-            label.update(f"{selected_marker}{theme_data['name']}")
+        """Update visual selection, repainting only the labels that changed."""
+        if self.selected_index == self._prev_selected:
+            return
+        self._theme_labels[self._prev_selected].update(self._theme_labels_unselected[self._prev_selected])
+        self._theme_labels[self.selected_index].update(self._theme_labels_selected[self.selected_index])
+        self._prev_selected = self.selected_index
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -600,11 +762,8 @@ class SettingsScreen(Screen):
     
     def get_selected_columns(self) -> int:
         """Return the selected column count."""
-        try:
-            columns_input = self.query_one("#columns_input", Input)
-            value = int(columns_input.value.strip())
-        except (ValueError, AttributeError):
-            value = self.column_count
+        columns_input = self.query_one("#columns_input", Input)
+        value = _parse_int(columns_input.value, self.column_count)
         return max(1, min(self.MAX_COLUMNS, value))
 
 
@@ -811,7 +970,7 @@ class MenuMaker(App):
     TITLE = "Menu Maker"
     SUB_TITLE = "Enhanced Categorized Menu System"
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("q,escape", "exit_app", "Exit", priority=True),
         Binding("e", "edit_item", "Edit", show=True),
         Binding("enter", "execute_item", "Execute", show=True),
@@ -829,118 +988,444 @@ class MenuMaker(App):
         Binding("ctrl+p", "cursor_up", "Up Alt", show=False),
         Binding("ctrl+n", "cursor_down", "Down Alt", show=False),
         Binding("ctrl+b", "scan_bin_directory", "Scan ./bin", show=True),
-    ]
+    )
     
     # Reactive state
     current_index = reactive(0)
-    menu_data = reactive({})
+    
+    # Theme CSS with {bg}/{primary}/{surface}/{text}/{accent} placeholders,
+    # filled from a THEMES entry with format_map
+    _CSS_TEMPLATE = """
+    Screen {{
+        background: {bg};
+    }}
+    
+    /* Responsive header - compact for small screens */
+    Header {{
+        background: {primary};
+        color: white;
+        text-align: center;
+        height: 1;
+        padding: 0;
+        margin: 0;
+    }}
+    
+    /* Compact footer for small screens */
+    Footer {{
+        background: {primary};
+        color: {text};
+        height: 1;
+        padding: 0;
+        margin: 0;
+    }}
+    
+    .main-container {{
+        height: 1fr;
+        border: none;
+        background: {surface};
+        padding: 0;
+        margin: 0;
+    }}
+    
+    /* Compact status bar */
+    .status-bar {{
+        dock: top;
+        height: 1;
+        background: {primary};
+        color: {text};
+        text-align: center;
+        padding: 0;
+        margin: 0;
+    }}
+    
+    /* Optimized menu container with minimal padding */
+    .menu-container {{
+        height: 1fr;
+        border: none;
+        background: {surface};
+        padding: 0;
+        margin: 0;
+        overflow-y: auto;
+    }}
+    
+    .columns-container {{
+        width: 100%;
+        height: 100%;
+        padding: 1 1;
+    }}
+    
+    .menu-column {{
+        width: 1fr;
+        min-width: 20;
+        padding-right: 1;
+    }}
+    
+    /* Compact category headers */
+    .category-header {{
+        height: 1;
+        padding: 0 1;
+        margin: 0;
+        background: {surface};
+        color: {text};
+        text-style: bold;
+        border: none;
+    }}
+    
+    .category-header.-selected {{
+        background: {accent};
+        color: {bg};
+    }}
+    
+    /* Compact menu items */
+    .menu-item {{
+        height: 1;
+        padding: 0 2;
+        margin: 0;
+        background: {surface};
+        color: {text};
+        border: none;
+    }}
+    
+    .menu-item.-selected {{
+        background: {accent};
+        color: {bg};
+        text-style: bold;
+    }}
+    
+    /* Responsive info container */
+    .info-container {{
+        align: center middle;
+        width: 90%;
+        max-width: 70;
+        height: auto;
+        background: {surface};
+        border: solid {accent};
+        padding: 1;
+    }}
+    
+    .info-title {{
+        text-align: center;
+        text-style: bold;
+        color: {accent};
+        margin-bottom: 0;
+    }}
+    
+    .info-field {{
+        color: {text};
+        margin-bottom: 0;
+    }}
+    
+    .info-description {{
+        color: {text};
+        text-style: italic;
+        margin-bottom: 0;
+    }}
+    
+    /* Responsive edit container */
+    .edit-container {{
+        align: left top;
+        width: 100%;
+        height: 100%;
+        background: {surface};
+        border: solid {accent};
+        padding: 1 2;
+    }}
+    
+    .edit-title {{
+        text-align: center;
+        text-style: bold;
+        color: {accent};
+        margin-bottom: 0;
+    }}
+    
+    /* Compact theme editor */
+    .theme-editor-container {{
+        width: 1fr;
+        height: 1fr;
+        background: {surface};
+        padding: 1;
+    }}
+    
+    .theme-editor-title {{
+        text-align: center;
+        text-style: bold;
+        color: {accent};
+        height: 1;
+    }}
+    
+    .theme-option {{
+        height: 2;
+        border: solid {primary};
+        margin-bottom: 0;
+        padding: 0 1;
+    }}
+    
+    /* Compact button row */
+    .button-row {{
+        align: center middle;
+        height: auto;
+        margin-top: 0;
+    }}
+    
+    .color-palette {{
+        height: 10;
+        overflow-y: auto;
+        border: solid {accent};
+        padding: 0 1;
+        margin-bottom: 1;
+    }}
+    
+    .color-button {{
+        height: auto;
+        text-align: left;
+        margin-bottom: 0;
+    }}
+    
+    .error-message {{
+        color: #ff6b6b;
+        height: 1;
+    }}
+    
+    Button {{
+        margin: 0;
+        padding: 0 1;
+    }}
+    """
+    
+    # Generated theme CSS per theme name
+    _css_cache: Dict[str, str] = {}
+    
+    # Raw config payloads shared across instances: path -> (mtime_ns, payload, payload hash).
+    # Only bytes are kept; objects are built when a payload is actually parsed
+    _json_cache: Dict[Path, Tuple[int, bytes, int]] = {}
     
     def __init__(self):
         super().__init__()
+        # Plain attribute: edits mutate it in place and call _rebuild_menu()
+        self.menu_data: Dict[str, Any] = {}
+        # (label, cmd) -> (category, position) for item lookups, plus the set of
+        # commands and installed bin files; built lazily, extended by
+        # add_new_item and dropped by edits that move or remove items
+        self._item_index: Optional[Dict[Tuple[str, str], Tuple[str, int]]] = None
+        self._cmd_set: Set[str] = set()
+        self._bin_file_set: Set[str] = set()
+        # Sanitized colors per category: name -> (raw colors object, sanitized pair)
+        self._category_color_cache: Dict[str, Tuple[Any, Optional[Dict[str, str]]]] = {}
+        # CSS classes already registered for category color pairs
+        self._category_css_classes: set = set()
         self.menu_widgets = []
         self.display_items = []  # Flattened list for navigation
+        # (label, cmd) -> position in display_items; built lazily and dropped
+        # whenever display_items changes
+        self._display_index: Optional[Dict[Tuple[str, str], int]] = None
+        # Column containers from the last full build and the category -> column
+        # layout they show, so column count changes can move just what changed
+        self._columns_wrapper: Optional[Horizontal] = None
+        self._column_widgets: List[Vertical] = []
+        self._last_column_layout: Optional[Dict[str, int]] = None
+        # Highlight bookkeeping: last selected index and which display_items
+        # build was last fully painted
+        self._prev_index = -1
+        self._display_generation = 0
+        self._highlight_generation = -1
         self.status_bar = None
         self.menu_container = None
-        self.custom_colors: List[Dict[str, str]] = copy.deepcopy(DEFAULT_COLOR_PAIRS)
-        self.theme_colors = SettingsScreen.THEMES["classic"].copy()
+        self.custom_colors: List[Dict[str, str]] = _default_custom_colors()
+        self.theme_colors = SettingsScreen.THEMES["classic"]
         self.column_count = 1
         self.max_columns = SettingsScreen.MAX_COLUMNS
         # Create config directory if it doesn't exist
-        config_dir = Path.home() / ".local" / "menu-maker"
-        config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = _ensure_config_dir()
         self.config_file = config_dir / "menus.json"
         self.theme_file = config_dir / "theme.json"
         self.app_theme = "classic"
+        # Theme whose CSS this app instance currently has applied
+        self._applied_theme: Optional[str] = None
         self.app_title = "Menu Maker — Enhanced Categorized Menu System"
         
         # Linux/Debian compatibility detection
         self.is_linux_system = self.detect_linux_system()
         self.terminal_type = self.detect_terminal_type()
-        
-        self.load_menu_data()
-        self.load_theme_data()
+        # Cached terminal width for the responsive title/status; refreshed on resize
+        self._term_width = self.detect_terminal_width()
+        
+        # Config files are read by a worker once the first frame is up;
+        # nothing is written back until they have been applied
+        self._data_loaded = False
+        # Hash of the last payload read from / written to each config file
+        self._last_saved_hash: Dict[Path, int] = {}
+        # Debounce timer for save_menu_data, and the latest menus.json
+        # snapshot (with its sequence number) waiting for the background writer.
+        # _save_lock only guards that hand-off; _write_lock serializes the
+        # actual file writes so the UI thread never waits on disk behind it.
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_menu_save: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._save_seq = 0
+        self._written_seq = 0
+        self._save_worker_active = False
     
     def detect_linux_system(self) -> bool:
         """Detect if running on Linux system."""
         try:
-            return os.name == 'posix' and 'linux' in os.uname().sysname.lower()
+            return os.name == 'posix' and 'linux' in _system_name().lower()
         except:
             return False
     
+    def detect_terminal_width(self) -> int:
+        """Return the terminal width in columns, defaulting to 80."""
+        try:
+            return os.get_terminal_size().columns
+        except (OSError, ValueError):
+            return 80
+    
+    def on_resize(self, event: Resize) -> None:
+        """Refresh the cached terminal width and the size-dependent text."""
+        self._term_width = event.size.width
+        self.update_title()
+        self.update_status()
+    
     def detect_terminal_type(self) -> str:
         """Detect terminal type for compatibility adjustments."""
         try:
-            term = os.environ.get('TERM', '').lower()
-            term_program = os.environ.get('TERM_PROGRAM', '').lower()
-            
-            if 'xterm' in term or 'gnome' in term_program:
-                return 'xterm'
-            elif 'screen' in term:
-                return 'screen'
-            elif 'tmux' in term:
-                return 'tmux'
-            elif 'linux' in term:
-                return 'linux_console'
-            else:
-                return 'unknown'
+            return _terminal_type()
         except:
             return 'unknown'
     
-    def load_menu_data(self) -> None:
-        """Load menu data from ~/.local/menu-maker/menus.json file."""
+    class DataLoaded(Message):
+        """Posted when the startup worker has read the config files."""
+        
+        def __init__(self, menu_data: Optional[Dict[str, Any]], theme_data: Optional[Dict[str, Any]]):
+            super().__init__()
+            self.menu_data = menu_data
+            self.theme_data = theme_data
+    
+    def read_config_files(self) -> None:
+        """Read menus.json and theme.json off the UI thread and post the result."""
+        # Check for migration from old location; once the new config exists
+        # this costs a single stat
         try:
-            # Check for migration from old location
             old_config = Path("menus.json")
-            if old_config.exists() and not self.config_file.exists():
+            if not self.config_file.exists() and old_config.exists():
                 # Migrate old config to new location
                 self.config_file.parent.mkdir(parents=True, exist_ok=True)
                 old_config.rename(self.config_file)
-            
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    self.menu_data = data.get('categories', {})
-                    loaded_colors = []
-                    for idx, entry in enumerate(data.get('custom_colors', []), start=1):
-                        pair = sanitize_color_pair(entry)
-                        if pair:
-                            loaded_colors.append({
-                                "name": entry.get("name") or f"Color {idx}",
-                                "background": pair["background"],
-                                "text": pair["text"]
-                            })
-                    if loaded_colors:
-                        self.custom_colors = loaded_colors
-                    # Load saved settings if available (but theme is now in separate file)
-                    if 'app_settings' in data:
-                        settings = data['app_settings']
-                        if 'title' in settings:
-                            self.app_title = settings['title']
-                        self.set_column_count(settings.get('columns', 1), apply_layout=False, save_on_change=False)
-                        # Remove old theme data if it exists (migration cleanup)
-                        if 'theme' in settings:
-                            del settings['theme']
-                            # Save cleaned data back
-                            data['app_settings'] = settings
-                            with open(self.config_file, 'w') as f:
-                                json.dump(data, f, indent=2)
+        except Exception:
+            pass
+        # Missing and unreadable files are both reported as None; either way
+        # the loaders fall back to (and write out) the defaults
+        self.post_message(self.DataLoaded(
+            self._read_json_file(self.config_file),
+            self._read_json_file(self.theme_file)
+        ))
+    
+    def _read_json_file(self, path: Path) -> Optional[Any]:
+        """Return parsed JSON from path, or None if it is missing or invalid."""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            # Reuse the payload if the file hasn't changed since we last saw it
+            cached = self._json_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._last_saved_hash[path] = cached[2]
+                return _json_loads(cached[1])
+            with open(path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                payload = f.read()
+            data = _json_loads(payload)
+            payload_hash = hash(payload)
+            self._json_cache[path] = (mtime, payload, payload_hash)
+            self._last_saved_hash[path] = payload_hash
+            return data
+        except Exception:
+            pass
+        return None
+    
+    def _write_json_file(self, path: Path, data: Any) -> None:
+        """Write data to path as JSON and keep the parsed-file cache current.
+        
+        Skips the write when the serialized payload matches what was last
+        read or written, and replaces the file atomically otherwise.
+        """
+        payload = _json_dumps(data)
+        payload_hash = hash(payload)
+        if self._last_saved_hash.get(path) == payload_hash:
+            return
+        tmp_path = path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Never leave a half-written temp file behind; the original is untouched
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        self._last_saved_hash[path] = payload_hash
+        self._json_cache[path] = (path.stat().st_mtime_ns, payload, payload_hash)
+    
+    def on_menu_maker_data_loaded(self, message: DataLoaded) -> None:
+        """Apply the config data read at startup and draw the menu."""
+        self._data_loaded = True
+        self.load_menu_data(message.menu_data)
+        self.load_theme_data(message.theme_data)
+        self.apply_theme(self.app_theme)
+        self.update_title()
+        self._rebuild_menu()
+        # Ensure proper initial index setting
+        object.__setattr__(self, 'current_index', 0)
+    
+    def load_menu_data(self, data: Optional[Dict[str, Any]]) -> None:
+        """Load menu data parsed from ~/.local/menu-maker/menus.json."""
+        try:
+            columns_normalized = False
+            if data is not None:
+                self.menu_data = _intern_categories(data.get('categories', {}))
+                self._item_index = None
+                loaded_colors = []
+                for idx, entry in enumerate(data.get('custom_colors', []), start=1):
+                    pair = sanitize_color_pair(entry)
+                    if pair:
+                        loaded_colors.append({
+                            "name": entry.get("name") or f"Color {idx}",
+                            "background": pair["background"],
+                            "text": pair["text"]
+                        })
+                if loaded_colors:
+                    self.custom_colors = loaded_colors
+                # Load saved settings if available (but theme is now in separate file)
+                if 'app_settings' in data:
+                    settings = data['app_settings']
+                    if 'title' in settings:
+                        self.app_title = settings['title']
+                    columns = self.clamp_column_count(settings.get('columns', 1))
+                    # Category columns were already normalized against this count when saved
+                    columns_normalized = settings.get('schema_column_count') == columns
+                    self.set_column_count(columns, apply_layout=False, save_on_change=False, normalize_columns=False)
+                    # Remove old theme data if it exists (migration cleanup)
+                    if 'theme' in settings:
+                        del settings['theme']
+                        # Save cleaned data back
+                        data['app_settings'] = settings
+                        self._write_json_file(self.config_file, data)
             else:
                 self.create_default_menu()
-            if self.ensure_category_columns():
+            if not columns_normalized and self.ensure_category_columns():
                 self.save_menu_data()
         except Exception as e:
             self.create_default_menu()
     
-    def load_theme_data(self) -> None:
-        """Load theme data from ~/.local/menu-maker/theme.json file in MC format."""
+    def load_theme_data(self, theme_data: Optional[Dict[str, Any]]) -> None:
+        """Load theme data parsed from ~/.local/menu-maker/theme.json in MC format."""
         try:
-            if self.theme_file.exists():
-                with open(self.theme_file, 'r') as f:
-                    theme_data = json.load(f)
-                    # MC-style format: {"skin": "theme_name", "colors": {...}}
-                    if 'skin' in theme_data:
-                        self.app_theme = theme_data['skin']
-                        # Don't apply theme yet - wait for on_mount
+            if theme_data is not None:
+                # MC-style format: {"skin": "theme_name", "colors": {...}}
+                if 'skin' in theme_data:
+                    self.app_theme = theme_data['skin']
             else:
                 # Create default theme file
                 self.app_theme = "classic"
@@ -952,6 +1437,8 @@ class MenuMaker(App):
     
     def save_theme_data(self) -> None:
         """Save theme data to ~/.local/menu-maker/theme.json in MC format."""
+        if not self._data_loaded:
+            return
         try:
             # Get current theme definition
             theme_def = SettingsScreen.THEMES.get(self.app_theme, SettingsScreen.THEMES["classic"])
@@ -974,8 +1461,7 @@ class MenuMaker(App):
                 }
             }
             
-            with open(self.theme_file, 'w') as f:
-                json.dump(theme_data, f, indent=2)
+            self._write_json_file(self.theme_file, theme_data)
         except Exception as e:
             pass  # Fail silently to avoid breaking the app
     
@@ -992,27 +1478,87 @@ class MenuMaker(App):
             }
         }
         self.menu_data = default_data
-        self.custom_colors = copy.deepcopy(DEFAULT_COLOR_PAIRS)
+        self._item_index = None
+        self.custom_colors = _default_custom_colors()
         self.save_menu_data()
     
     def save_menu_data(self) -> None:
-        """Save menu data to ~/.local/menu-maker/menus.json file."""
-        try:
-            # Ensure config directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            data = {
-                "categories": self.menu_data,
-                "app_settings": {
-                    "title": self.app_title,
-                    "columns": self.column_count
-                },
-                "custom_colors": self.custom_colors
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            pass  # Silently handle save errors
+        """Schedule a save of menu data to ~/.local/menu-maker/menus.json.
+        
+        Calls within _SAVE_DELAY_SECONDS of each other collapse into one write.
+        """
+        if not self._data_loaded:
+            return
+        if self._save_timer is not None:
+            self._save_timer.reset()
+        else:
+            self._save_timer = self.set_timer(_SAVE_DELAY_SECONDS, self._queue_menu_save)
+    
+    def _menu_snapshot(self) -> Dict[str, Any]:
+        """Return a detached copy of everything stored in menus.json."""
+        return _clone_json({
+            "categories": self.menu_data,
+            "app_settings": {
+                "title": self.app_title,
+                "columns": self.column_count,
+                "schema_column_count": self.column_count
+            },
+            "custom_colors": self.custom_colors
+        })
+    
+    def _queue_menu_save(self) -> None:
+        """Hand the current menu state to the background writer."""
+        self._save_timer = None
+        snapshot = self._menu_snapshot()
+        with self._save_lock:
+            self._save_seq += 1
+            self._pending_menu_save = (self._save_seq, snapshot)
+            if self._save_worker_active:
+                return
+            self._save_worker_active = True
+        self.run_worker(self._write_pending_menu_saves, thread=True, group="menu-save")
+    
+    def _write_pending_menu_saves(self) -> None:
+        """Worker: write the latest queued menu snapshot until none are left."""
+        while True:
+            with self._save_lock:
+                pending = self._pending_menu_save
+                self._pending_menu_save = None
+                if pending is None:
+                    self._save_worker_active = False
+                    return
+            self._write_menu_snapshot(*pending)
+    
+    def flush_menu_save(self) -> None:
+        """Write any scheduled or queued menu save right away."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.stop()
+                self._save_timer = None
+                self._save_seq += 1
+                pending = (self._save_seq, self._menu_snapshot())
+            else:
+                pending = self._pending_menu_save
+            self._pending_menu_save = None
+        if pending is not None:
+            self._write_menu_snapshot(*pending)
+    
+    def _write_menu_snapshot(self, seq: int, data: Dict[str, Any]) -> None:
+        """Write a menu snapshot to disk unless a newer one was already written."""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return
+            self._written_seq = seq
+            try:
+                # Ensure config directory exists
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                self._write_json_file(self.config_file, data)
+            except Exception as e:
+                pass  # Silently handle save errors
+    
+    def on_unmount(self) -> None:
+        """Make sure pending menu changes reach disk on shutdown."""
+        self.flush_menu_save()
     
     def compose(self) -> ComposeResult:
         """Create the application layout."""
@@ -1032,16 +1578,17 @@ class MenuMaker(App):
     
     def on_mount(self) -> None:
         """Initialize after mounting."""
-        # Apply loaded theme first
-        self.apply_theme(self.app_theme)
         self.update_title()
-        self.update_menu_display()
-        self.update_status()
-        # Ensure proper initial index setting
-        object.__setattr__(self, 'current_index', 0)
+        if self.menu_container:
+            self.menu_container.mount(Static("    Loading…", classes="menu-item"))
+        self.run_worker(self.read_config_files, thread=True, exclusive=True)
     
-    def update_menu_display(self) -> None:
-        """Update menu display with categories and items."""
+    def update_menu_display(self, reset_scroll: bool = False) -> None:
+        """Update menu display with categories and items.
+        
+        The scroll position is kept unless reset_scroll is set (e.g. after
+        the column layout changes).
+        """
         if not self.menu_container:
             return
         
@@ -1049,64 +1596,57 @@ class MenuMaker(App):
         self.menu_container.remove_children()
         self.menu_widgets.clear()
         self.display_items.clear()
+        self._display_index = None
+        self._display_generation += 1
         
         # Remove empty categories first
         self.cleanup_empty_categories()
         
-        columns_wrapper = Horizontal(classes="columns-container")
-        self.menu_container.mount(columns_wrapper)
-        column_containers: Dict[int, Vertical] = {}
-        for column_index in range(1, self.column_count + 1):
-            column_container = Vertical(classes="menu-column", id=f"column_{column_index}")
-            columns_wrapper.mount(column_container)
-            column_containers[column_index] = column_container
-        
+        # Single pass over menu_data: normalize each category's column and
+        # build its widgets straight into that column's lists
         columns_changed = False
-        columns_content: Dict[int, List[Tuple[str, Dict[str, Any]]]] = {i: [] for i in range(1, self.column_count + 1)}
+        category_colors = {name: self.get_category_color_pair(name) for name in self.menu_data}
+        column_widgets: Dict[int, List[Static]] = {i: [] for i in range(1, self.column_count + 1)}
+        column_entries: Dict[int, List[Dict[str, Any]]] = {i: [] for i in range(1, self.column_count + 1)}
         for category_name, category_data in self.menu_data.items():
             column_index = self.normalize_column_value(category_data.get('column', 1))
             if category_data.get('column') != column_index:
                 category_data['column'] = column_index
                 columns_changed = True
-            columns_content.setdefault(column_index, []).append((category_name, category_data))
+            widgets = column_widgets[column_index]
+            entries = column_entries[column_index]
+            
+            # Add category header with proper prefix
+            is_expanded = category_data.get('expanded', True)
+            colors = category_colors[category_name]
+            category_header = self.make_category_header(category_name, is_expanded, colors)
+            widgets.append(category_header)
+            entries.append({"type": "category", "name": category_name, "widget": category_header})
+            
+            # Add items if expanded
+            if is_expanded:
+                for item in category_data.get('items', []):
+                    item_widget = self.make_item_widget(item, colors)
+                    widgets.append(item_widget)
+                    entries.append({"type": "item", "data": item, "widget": item_widget})
         
         if columns_changed:
             self.save_menu_data()
         
-        # Build flattened display list and widgets
-        total_items = 0
+        # Attach the whole column tree with one mount
+        self._column_widgets = [
+            Vertical(*column_widgets[column_index], classes="menu-column")
+            for column_index in range(1, self.column_count + 1)
+        ]
+        self._columns_wrapper = Horizontal(*self._column_widgets, classes="columns-container")
+        self.menu_container.mount(self._columns_wrapper)
+        self._last_column_layout = {name: data['column'] for name, data in self.menu_data.items()}
+        
+        # Navigation order is column by column
         for column_index in range(1, self.column_count + 1):
-            column_container = column_containers[column_index]
-            for category_name, category_data in columns_content.get(column_index, []):
-                # Add category header with proper prefix
-                is_expanded = category_data.get('expanded', True)
-                header_text = f"▼{category_name}" if is_expanded else f"▶{category_name}"
-                
-                category_header = Static(header_text, classes="category-header")
-                category_colors = self.get_category_color_pair(category_name)
-                if category_colors:
-                    category_header.base_bg = category_colors["background"]
-                    category_header.base_text = category_colors["text"]
-                else:
-                    category_header.base_bg = None
-                    category_header.base_text = None
-                column_container.mount(category_header)
-                self.menu_widgets.append(category_header)
-                self.display_items.append({"type": "category", "name": category_name, "widget": category_header})
-                total_items += 1
-                
-                # Add items if expanded
-                if is_expanded:
-                    items = category_data.get('items', [])
-                    for item in items:
-                        item_widget = Static(f"    {item['label']}", classes="menu-item")
-                        if category_colors:
-                            item_widget.base_bg = category_colors["background"]
-                            item_widget.base_text = category_colors["text"]
-                        column_container.mount(item_widget)
-                        self.menu_widgets.append(item_widget)
-                        self.display_items.append({"type": "item", "data": item, "widget": item_widget})
-                        total_items += 1
+            self.display_items.extend(column_entries[column_index])
+        self.menu_widgets.extend(entry["widget"] for entry in self.display_items)
+        total_items = len(self.display_items)
         
         # Force container refresh and multiple highlighting updates for cross-platform compatibility
         if self.menu_container:
@@ -1115,28 +1655,178 @@ class MenuMaker(App):
         # Force immediate highlighting update and ensure container shows all content
         self.update_highlighting()
         
-        # Ensure container can scroll and shows all content
         if self.menu_container and total_items > 0:
-            # Force container to show all content and reset scroll position
-            self.menu_container.scroll_home(animate=False)
+            if reset_scroll:
+                self.menu_container.scroll_home(animate=False)
             # Ensure the current selection is visible
             if 0 <= self.current_index < len(self.display_items):
                 try:
                     widget = self.display_items[self.current_index]["widget"]
-                    widget.scroll_visible()
+                    widget.scroll_visible(animate=False)
                 except (IndexError, KeyError):
                     pass
     
-    def cleanup_empty_categories(self) -> None:
-        """Remove categories that have no items."""
-        updated_data = {}
+    def _relayout_columns(self, reset_scroll: bool = False) -> bool:
+        """Move only the categories whose column changed, adding or dropping columns as needed.
+        
+        Returns False if the menu has to be rebuilt instead (nothing drawn
+        yet, or categories were added or removed since the last full build).
+        """
+        wrapper = self._columns_wrapper
+        previous = self._last_column_layout
+        if wrapper is None or previous is None or not wrapper.is_attached or previous.keys() != self.menu_data.keys():
+            return False
+        layout = {name: self.normalize_column_value(data.get('column', 1)) for name, data in self.menu_data.items()}
+        moved = {name for name, column in layout.items() if previous[name] != column}
+        columns = self._column_widgets
+        if not moved and len(columns) == self.column_count:
+            return True
+        
+        # Group the current entries by category (a header is followed by its items)
+        # and note where the selection sits within its group
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        selected_group = None
+        selected_offset = 0
+        for i, entry in enumerate(self.display_items):
+            if entry["type"] == "category":
+                group_name = entry["name"]
+                group = groups[group_name] = []
+            group.append(entry)
+            if i == self.current_index:
+                selected_group = group_name
+                selected_offset = len(group) - 1
+        if groups.keys() != layout.keys():
+            return False
+        
+        # Columns carry no id: ones removed a moment ago may not be pruned yet
+        while len(columns) < self.column_count:
+            column = Vertical(classes="menu-column")
+            wrapper.mount(column)
+            columns.append(column)
+        
+        # Recreate each moved category in its new column, right after the
+        # category that precedes it there; everything else stays mounted
+        last_in_column: Dict[int, Static] = {}
         for category_name, category_data in self.menu_data.items():
-            items = category_data.get('items', [])
-            if items:  # Only keep categories that have items
-                updated_data[category_name] = category_data
+            column_index = layout[category_name]
+            if category_name in moved:
+                for entry in groups[category_name]:
+                    entry["widget"].remove()
+                is_expanded = category_data.get('expanded', True)
+                colors = self.get_category_color_pair(category_name)
+                category_header = self.make_category_header(category_name, is_expanded, colors)
+                entries = [{"type": "category", "name": category_name, "widget": category_header}]
+                if is_expanded:
+                    for item in category_data.get('items', []):
+                        entries.append({"type": "item", "data": item, "widget": self.make_item_widget(item, colors)})
+                groups[category_name] = entries
+                widgets = [entry["widget"] for entry in entries]
+                column = columns[column_index - 1]
+                anchor = last_in_column.get(column_index)
+                if anchor is not None:
+                    column.mount_all(widgets, after=anchor)
+                elif column.children:
+                    column.mount_all(widgets, before=0)
+                else:
+                    column.mount_all(widgets)
+            last_in_column[column_index] = groups[category_name][-1]["widget"]
+        
+        for column in columns[self.column_count:]:
+            column.remove()
+        del columns[self.column_count:]
         
-        if updated_data != self.menu_data:
-            self.menu_data = updated_data
+        # Navigation order is column by column
+        display_items = []
+        for column_index in range(1, self.column_count + 1):
+            for category_name, column in layout.items():
+                if column == column_index:
+                    if category_name == selected_group:
+                        selected_index = len(display_items) + selected_offset
+                    display_items.extend(groups[category_name])
+        self.display_items[:] = display_items
+        self.menu_widgets[:] = [entry["widget"] for entry in display_items]
+        self._display_index = None
+        self._display_generation += 1
+        self._last_column_layout = layout
+        
+        if selected_group is not None:
+            self.current_index = selected_index
+        if reset_scroll and self.menu_container:
+            self.menu_container.scroll_home(animate=False)
+        self.update_highlighting()
+        return True
+    
+    def _apply_column_layout(self, reset_scroll: bool = False) -> None:
+        """Show the current column assignments, rebuilding the menu only if needed."""
+        if not self._relayout_columns(reset_scroll):
+            self.update_menu_display(reset_scroll=reset_scroll)
+        self.update_status()
+    
+    def make_category_header(self, category_name: str, is_expanded: bool, category_colors: Optional[Dict[str, str]]) -> Static:
+        """Create the header widget for a category."""
+        header_text = f"▼{category_name}" if is_expanded else f"▶{category_name}"
+        color_class = self.category_color_class(category_colors)
+        classes = f"category-header {color_class}" if color_class else "category-header"
+        return Static(header_text, classes=classes)
+    
+    def make_item_widget(self, item: Dict[str, Any], category_colors: Optional[Dict[str, str]]) -> Static:
+        """Create the widget for a menu item."""
+        color_class = self.category_color_class(category_colors)
+        classes = f"menu-item {color_class}" if color_class else "menu-item"
+        return Static(f"    {item['label']}", classes=classes)
+    
+    def toggle_category_items(self, category_name: str) -> bool:
+        """Mount or remove one category's item widgets to match its expanded state.
+        
+        Returns False if the category header isn't on screen, in which case
+        the caller should fall back to update_menu_display().
+        """
+        header_idx = None
+        for i, entry in enumerate(self.display_items):
+            if entry["type"] == "category" and entry["name"] == category_name:
+                header_idx = i
+                break
+        if header_idx is None:
+            return False
+        
+        category_data = self.menu_data[category_name]
+        is_expanded = category_data.get('expanded', True)
+        category_header = self.display_items[header_idx]["widget"]
+        category_header.update(f"▼{category_name}" if is_expanded else f"▶{category_name}")
+        
+        # The category's item entries directly follow its header
+        start = header_idx + 1
+        end = start
+        while end < len(self.display_items) and self.display_items[end]["type"] == "item":
+            end += 1
+        for entry in self.display_items[start:end]:
+            entry["widget"].remove()
+        del self.display_items[start:end]
+        del self.menu_widgets[start:end]
+        self._display_index = None
+        
+        if is_expanded:
+            category_colors = self.get_category_color_pair(category_name)
+            entries = []
+            for item in category_data.get('items', []):
+                item_widget = self.make_item_widget(item, category_colors)
+                entries.append({"type": "item", "data": item, "widget": item_widget})
+            if entries:
+                category_header.parent.mount_all([entry["widget"] for entry in entries], after=category_header)
+            self.display_items[start:start] = entries
+            self.menu_widgets[start:start] = [entry["widget"] for entry in entries]
+        
+        if self._prev_index > header_idx:
+            # Indices after the header shifted; repaint everything next time
+            self._display_generation += 1
+        return True
+    
+    def cleanup_empty_categories(self) -> None:
+        """Remove categories that have no items."""
+        to_remove = [name for name, data in self.menu_data.items() if not data.get('items')]
+        if to_remove:
+            for category_name in to_remove:
+                del self.menu_data[category_name]
             self.save_menu_data()
 
     def clamp_column_count(self, value: Any) -> int:
@@ -1149,10 +1839,16 @@ class MenuMaker(App):
 
     def normalize_column_value(self, value: Any) -> int:
         """Normalize a category column to current limits."""
-        try:
-            column = int(value)
-        except (TypeError, ValueError):
-            column = 1
+        if type(value) is int:
+            # Already-validated columns: skip conversion, and skip the clamp when in range
+            if 1 <= value <= self.column_count:
+                return value
+            column = value
+        else:
+            try:
+                column = int(value)
+            except (TypeError, ValueError):
+                column = 1
         return max(1, min(self.column_count, column))
 
     def ensure_category_columns(self) -> bool:
@@ -1166,45 +1862,56 @@ class MenuMaker(App):
                 changed = True
         return changed
 
-    def set_column_count(self, count: Any, apply_layout: bool = True, persist: bool = False, save_on_change: bool = True) -> bool:
+    def set_column_count(self, count: Any, apply_layout: bool = True, persist: bool = False, save_on_change: bool = True, normalize_columns: bool = True) -> bool:
         """Set the column count and optionally persist the change."""
         normalized = self.clamp_column_count(count)
         changed = normalized != self.column_count
         self.column_count = normalized
-        columns_changed = self.ensure_category_columns()
+        columns_changed = self.ensure_category_columns() if normalize_columns else False
         if persist or (save_on_change and (changed or columns_changed)):
             self.save_menu_data()
         if apply_layout and self.menu_container:
-            self.update_menu_display()
-            self.update_status()
+            self._apply_column_layout(reset_scroll=changed)
         return changed or columns_changed
 
     def get_category_color_pair(self, category_name: str) -> Optional[Dict[str, str]]:
         """Return sanitized color pair for a category if it exists."""
         category_data = self.menu_data.get(category_name, {})
-        return sanitize_color_pair(category_data.get('colors'))
+        colors = category_data.get('colors')
+        # Entries are keyed by name and only valid for the same colors object
+        cached = self._category_color_cache.get(category_name)
+        if cached is not None and cached[0] is colors:
+            return cached[1]
+        sanitized = sanitize_color_pair(colors)
+        self._category_color_cache[category_name] = (colors, sanitized)
+        return sanitized
 
     def apply_widget_colors(self, widget: Optional[Static], selected: bool = False) -> None:
-        """Apply either highlight or base colors to a widget."""
-        if not widget or not hasattr(widget, "styles"):
+        """Apply either highlight or base colors to a widget.
+        
+        Both come from CSS: the theme's -selected rules for the highlight and
+        the category's color class (see category_color_class) for the base.
+        """
+        if not widget or not hasattr(widget, "set_class"):
             return
-        try:
-            if selected:
-                highlight_bg = self.theme_colors.get("accent", "#00f5ff")
-                highlight_text = self.theme_colors.get("bg", "#023047")
-                widget.styles.background = highlight_bg
-                widget.styles.color = highlight_text
-                return
-            base_bg = getattr(widget, "base_bg", None)
-            base_text = getattr(widget, "base_text", None)
-            if base_bg and base_text:
-                widget.styles.background = base_bg
-                widget.styles.color = base_text
-            else:
-                widget.styles.background = None
-                widget.styles.color = None
-        except Exception:
-            pass
+        widget.set_class(selected, "-selected")
+    
+    def category_color_class(self, category_colors: Optional[Dict[str, str]]) -> Optional[str]:
+        """Return the CSS class painting a category color pair, registering it on first use."""
+        if not category_colors:
+            return None
+        background = category_colors["background"]
+        text = category_colors["text"]
+        class_name = f"cat-{background[1:]}-{text[1:]}"
+        if class_name not in self._category_css_classes:
+            # Static.<class> outranks the theme's .menu-item/.category-header
+            # rules, while their -selected variants still win over it
+            self.stylesheet.add_source(
+                f"Static.{class_name} {{ background: {background}; color: {text}; }}",
+                read_from=("", class_name)
+            )
+            self._category_css_classes.add(class_name)
+        return class_name
     
     def update_highlighting(self) -> None:
         """Update visual highlighting with enhanced Linux compatibility."""
@@ -1215,15 +1922,19 @@ class MenuMaker(App):
         current_idx = max(0, min(self.current_index, len(self.display_items) - 1))
         object.__setattr__(self, 'current_index', current_idx)
 
-        # Clear all selections with explicit widget access and platform-specific timing
-        for i, item in enumerate(self.display_items):
-            widget = item.get("widget")
+        if self._highlight_generation != self._display_generation:
+            # Widgets were rebuilt: paint base colors on all of them once
+            for i, item in enumerate(self.display_items):
+                widget = item.get("widget")
+                if widget and hasattr(widget, "remove_class"):
+                    self.apply_widget_colors(widget, selected=False)
+            self._highlight_generation = self._display_generation
+        elif 0 <= self._prev_index < len(self.display_items) and self._prev_index != current_idx:
+            # Same widgets as last time: only the previous selection needs clearing
+            widget = self.display_items[self._prev_index].get("widget")
             if widget and hasattr(widget, "remove_class"):
-                widget.remove_class("-selected")
                 self.apply_widget_colors(widget, selected=False)
-                # Force immediate refresh for Linux systems
-                if hasattr(widget, "refresh"):
-                    widget.refresh()
+        self._prev_index = current_idx
         
         # Apply selection to current item with explicit validation
         if 0 <= current_idx < len(self.display_items):
@@ -1231,12 +1942,12 @@ class MenuMaker(App):
             current_widget = current_item.get("widget")
             
             if current_widget and hasattr(current_widget, "add_class"):
-                current_widget.add_class("-selected")
                 self.apply_widget_colors(current_widget, selected=True)
                 
-                # Force immediate visual update for Linux terminals
-                if hasattr(current_widget, "refresh"):
-                    current_widget.refresh()
+                # Class changes already schedule a repaint; Linux terminals get
+                # one container-level refresh instead of one per widget
+                if self.is_linux_system and self.menu_container:
+                    self.menu_container.refresh()
                 
                 # Enhanced scrolling with Linux-specific optimizations
                 if self.menu_container:
@@ -1332,13 +2043,7 @@ class MenuMaker(App):
     def update_title(self) -> None:
         """Update the header title with responsive sizing."""
         if hasattr(self, 'header'):
-            # Get terminal size for responsive title
-            try:
-                import os
-                terminal_width = os.get_terminal_size().columns
-            except:
-                terminal_width = 80
-            
+            terminal_width = self._term_width
             if terminal_width < 60:
                 # Ultra compact title for very small terminals
                 self.title = "Menu"
@@ -1358,13 +2063,7 @@ class MenuMaker(App):
             total = len(self.display_items)
             current = self.current_index + 1 if self.display_items else 0
             
-            # Get terminal size for responsive status
-            try:
-                import os
-                terminal_width = os.get_terminal_size().columns
-            except:
-                terminal_width = 80
-            
+            terminal_width = self._term_width
             if terminal_width < 60:
                 # Ultra compact for very small terminals (52x10)
                 self.status_bar.update(f"{current}/{total} | ↑↓")
@@ -1382,9 +2081,13 @@ class MenuMaker(App):
         # Disable reactive updates to prevent conflicts
         pass
     
-    def watch_menu_data(self, new_data: Dict[str, Any]) -> None:
-        """React to menu data changes."""
-        self.update_menu_display()
+    def _rebuild_menu(self, reset_scroll: bool = False) -> None:
+        """Redraw the menu after menu_data has changed.
+        
+        This is the single redraw point for edits; callers mutate menu_data
+        in place and call it once (there is no menu_data watcher).
+        """
+        self.update_menu_display(reset_scroll=reset_scroll)
         self.update_status()
     
     async def action_cursor_up(self) -> None:
@@ -1459,6 +2162,8 @@ class MenuMaker(App):
                 print("=" * 60)
                 print()
                 
+                # Only needed when a command actually runs, so import lazily
+                import subprocess
                 result = subprocess.run(command, shell=True)
                 
                 if pause:
@@ -1478,6 +2183,8 @@ class MenuMaker(App):
     
     async def action_toggle_category(self) -> None:
         """Toggle category expansion and save state."""
+        if not self._data_loaded:
+            return  # Config still loading; an edit now would be overwritten
         if not self.display_items or self.current_index >= len(self.display_items):
             return
         
@@ -1485,24 +2192,25 @@ class MenuMaker(App):
         
         if current_item["type"] == "category":
             category_name = current_item["name"]
-            if category_name in self.menu_data:
+            category_data = self.menu_data.get(category_name)
+            if category_data is not None:
                 # Remember the category we're toggling to restore position
                 selected_category = category_name
                 
                 # Toggle expanded state
-                current_state = self.menu_data[category_name].get('expanded', True)
-                updated_data = dict(self.menu_data)
-                updated_data[category_name]['expanded'] = not current_state
-                self.menu_data = updated_data
+                category_data['expanded'] = not category_data.get('expanded', True)
                 
                 # Save state to persist across restarts
                 self.save_menu_data()
                 
-                # Update display to reflect changes
-                self.update_menu_display()
+                # Mount/remove just this category's items rather than rebuilding
+                if not self.toggle_category_items(category_name):
+                    self.update_menu_display()
                 
                 # Restore position to the same category after display update
                 self.restore_position_to_category(selected_category)
+                self.update_highlighting()
+                self.update_status()
     
     def restore_position_to_category(self, category_name: str) -> None:
         """Restore cursor position to the specified category after display update."""
@@ -1511,19 +2219,23 @@ class MenuMaker(App):
                 self.current_index = i
                 break
     
+    def _build_display_index(self) -> Dict[Tuple[str, str], int]:
+        """Map each displayed item's (label, cmd) to its position; the first match wins."""
+        index: Dict[Tuple[str, str], int] = {}
+        for i, entry in enumerate(self.display_items):
+            if entry["type"] == "item":
+                index.setdefault((entry["data"].get('label', ''), entry["data"].get('cmd', '')), i)
+        self._display_index = index
+        return index
+    
     def navigate_to_item(self, target_item: Dict[str, str]) -> None:
         """Navigate to a specific item in the menu display."""
-        target_label = target_item.get('label', '')
-        target_cmd = target_item.get('cmd', '')
-        
-        for i, item in enumerate(self.display_items):
-            if (item["type"] == "item" and 
-                item["data"].get('label', '') == target_label and
-                item["data"].get('cmd', '') == target_cmd):
-                self.current_index = i
-                self.update_highlighting()
-                self.update_status()
-                break
+        index = self._display_index if self._display_index is not None else self._build_display_index()
+        position = index.get((target_item.get('label', ''), target_item.get('cmd', '')))
+        if position is not None:
+            self.current_index = position
+            self.update_highlighting()
+            self.update_status()
     
     def action_show_info(self) -> None:
         """Show info for current item."""
@@ -1539,6 +2251,8 @@ class MenuMaker(App):
     
     def action_edit_item(self) -> None:
         """Edit the currently selected item or category."""
+        if not self._data_loaded:
+            return  # Config still loading; an edit now would be overwritten
         if not self.display_items or self.current_index >= len(self.display_items):
             return
         
@@ -1585,6 +2299,8 @@ class MenuMaker(App):
     
     def action_new_item(self) -> None:
         """Create a new menu item."""
+        if not self._data_loaded:
+            return  # Config still loading; an edit now would be overwritten
         categories = list(self.menu_data.keys())
         if not categories:
             categories = ["General"]
@@ -1599,115 +2315,155 @@ class MenuMaker(App):
     
     def add_new_item(self, item_data: Dict[str, str]) -> None:
         """Add a new item to the menu."""
-        category = item_data.get('category', 'General')
-        
-        # Ensure category exists
-        updated_data = dict(self.menu_data)
-        if category not in updated_data:
-            updated_data[category] = {
-                "expanded": True,
-                "column": self.normalize_column_value(1),
-                "items": []
-            }
-        
-        # Add item to category
-        updated_data[category]['items'].append(item_data)
-        self.menu_data = updated_data
+        if self.has_command(item_data.get('cmd', '')):
+            # Duplicate command; nothing to save or redraw, but say why
+            self.notify("An item with that command already exists", severity="warning")
+            return
+        self._append_item(item_data)
         self.save_menu_data()
-        self.update_menu_display()
+        self._rebuild_menu()
+    
+    def _add_items_bulk(self, items: List[Dict[str, str]]) -> None:
+        """Add several items to the menu with a single save and redraw."""
+        added = False
+        for item_data in items:
+            if not self.has_command(item_data.get('cmd', '')):
+                self._append_item(item_data)
+                added = True
+        if added:
+            self.save_menu_data()
+            self._rebuild_menu()
+    
+    def has_command(self, cmd: str) -> bool:
+        """Return True if some menu item already runs this command."""
+        cmd = cmd.strip()
+        if not cmd:
+            return False
+        if self._item_index is None:
+            self._rebuild_item_index()
+        return cmd in self._cmd_set
+    
+    def _append_item(self, item_data: Dict[str, str]) -> None:
+        """Append an item to its category, creating the category if needed."""
+        category = sys.intern(item_data.get('category', 'General'))
+        if 'category' in item_data:
+            item_data['category'] = category
+        items = self.menu_data.setdefault(category, {
+            "expanded": True,
+            "column": self.normalize_column_value(1),
+            "items": []
+        })['items']
+        items.append(item_data)
+        if self._item_index is not None:
+            self._index_item(category, len(items) - 1, item_data)
+    
+    def _rebuild_item_index(self) -> Dict[Tuple[str, str], Tuple[str, int]]:
+        """Index every item by (label, cmd); the first match wins."""
+        self._item_index = {}
+        self._cmd_set = set()
+        self._bin_file_set = set()
+        for category_name, category_data in self.menu_data.items():
+            for position, item in enumerate(category_data.get('items', [])):
+                self._index_item(category_name, position, item)
+        return self._item_index
+    
+    def _index_item(self, category_name: str, position: int, item: Dict[str, str]) -> None:
+        """Record one item in the lookup index and command sets."""
+        self._item_index.setdefault((item.get('label', ''), item.get('cmd', '')), (category_name, position))
+        cmd = item.get('cmd', '').strip()
+        if cmd:
+            self._cmd_set.add(cmd)
+            # Extract filename from command path
+            if cmd.startswith('~/.local/menu-maker/bin/'):
+                self._bin_file_set.add(Path(cmd).name)
+    
+    def find_item_location(self, label: str, cmd: str) -> Optional[Tuple[str, int]]:
+        """Return (category, position) of the item with this label and command."""
+        key = (label, cmd)
+        fresh = self._item_index is None
+        index = self._rebuild_item_index() if fresh else self._item_index
+        location = index.get(key)
+        if location is not None:
+            items = self.menu_data.get(location[0], {}).get('items', [])
+            if location[1] < len(items):
+                item = items[location[1]]
+                if (item.get('label', ''), item.get('cmd', '')) == key:
+                    return location
+        if fresh:
+            return None
+        # The index went stale since the last rebuild; refresh it once
+        return self._rebuild_item_index().get(key)
     
     def update_item(self, old_item: Dict[str, str], new_item: Dict[str, str]) -> None:
         """Update an existing item and handle category changes."""
-        updated_data = dict(self.menu_data)
-        
-        old_label = old_item.get('label', '')
-        old_cmd = old_item.get('cmd', '')
-        old_category = old_item.get('category', '')
-        new_category = new_item.get('category', '')
+        new_category = sys.intern(new_item.get('category', ''))
+        if 'category' in new_item:
+            new_item['category'] = new_category
         
         # Find and remove the item from its current category
-        item_found = False
-        for category_name, category_data in updated_data.items():
-            items = category_data.get('items', [])
-            for i, item in enumerate(items):
-                # Match by label and command to find the right item
-                if (item.get('label', '') == old_label and 
-                    item.get('cmd', '') == old_cmd):
-                    # Remove from current category
-                    items.pop(i)
-                    item_found = True
-                    break
-            if item_found:
-                break
-        
-        if not item_found:
+        location = self.find_item_location(old_item.get('label', ''), old_item.get('cmd', ''))
+        if location is None:
             return
+        category_name, position = location
+        self.menu_data[category_name]['items'].pop(position)
+        self._item_index = None
+        
+        # Add item to new category, creating it if it doesn't exist
+        self.menu_data.setdefault(new_category, {
+            "expanded": True,
+            "column": self.normalize_column_value(1),
+            "items": []
+        })['items'].append(new_item)
+        
+        # Only the category the item left can have become empty; the rebuild
+        # prunes any other empty category as well
+        if not self.menu_data[category_name].get('items'):
+            del self.menu_data[category_name]
         
-        # Create new category if it doesn't exist
-        if new_category not in updated_data:
-            updated_data[new_category] = {
-                "expanded": True,
-                "column": self.normalize_column_value(1),
-                "items": []
-            }
-        
-        # Add item to new category
-        updated_data[new_category]['items'].append(new_item)
-        
-        # Clean up empty categories
-        categories_to_remove = []
-        for category_name, category_data in updated_data.items():
-            if not category_data.get('items', []):
-                categories_to_remove.append(category_name)
-        
-        for category_name in categories_to_remove:
-            del updated_data[category_name]
-        
-        self.menu_data = updated_data
         self.save_menu_data()
-        self.update_menu_display()
+        self._rebuild_menu()
         
         # Navigate to the item in its new category
         self.navigate_to_item(new_item)
     
     def update_category_details(self, old_name: str, new_name: str, colors: Optional[Dict[str, str]], column: Optional[int]) -> None:
         """Update category name, colors, and column assignments."""
-        if old_name not in self.menu_data:
+        category_data = self.menu_data.get(old_name)
+        if category_data is None:
             return
         
         sanitized_colors = sanitize_color_pair(colors)
-        updated_data = dict(self.menu_data)
-        category_data = updated_data[old_name].copy()
         column_value = self.normalize_column_value(column if column is not None else category_data.get('column', 1))
         category_data['column'] = column_value
         
         if sanitized_colors:
             category_data['colors'] = sanitized_colors
-        elif 'colors' in category_data:
-            del category_data['colors']
+        else:
+            category_data.pop('colors', None)
         
-        target_name = new_name or old_name
-        if target_name != old_name and target_name in updated_data:
+        target_name = sys.intern(new_name or old_name)
+        if target_name != old_name and target_name in self.menu_data:
             # Shouldn't happen due to validation, but guard against overwriting
             target_name = old_name
         
         if target_name != old_name:
             for item in category_data.get('items', []):
                 item['category'] = target_name
-            updated_data[target_name] = category_data
-            del updated_data[old_name]
-        else:
-            updated_data[old_name] = category_data
+            self.menu_data[target_name] = self.menu_data.pop(old_name)
+            self._item_index = None
         
-        self.menu_data = updated_data
+        self._category_color_cache.pop(old_name, None)
+        self._category_color_cache.pop(target_name, None)
         self.save_menu_data()
-        self.update_menu_display()
+        self._rebuild_menu()
         self.restore_position_to_category(target_name)
         self.update_highlighting()
         self.update_status()
     
     async def action_delete_item(self) -> None:
         """Delete the currently selected item."""
+        if not self._data_loaded:
+            return  # Config still loading; an edit now would be overwritten
         if not self.display_items or self.current_index >= len(self.display_items):
             return
         
@@ -1718,19 +2474,21 @@ class MenuMaker(App):
             category = item_data.get('category')
             
             # Remove item from category
-            updated_data = dict(self.menu_data)
-            if category in updated_data:
-                items = updated_data[category].get('items', [])
-                if item_data in items:
-                    items.remove(item_data)
+            category_data = self.menu_data.get(category)
+            if category_data is not None:
+                items = category_data.get('items', [])
+                # The display entry holds the very dict stored in the list
+                position = next((i for i, item in enumerate(items) if item is item_data), None)
+                if position is not None:
+                    del items[position]
+                    self._item_index = None
                     
                     # Remove empty category
                     if not items:
-                        del updated_data[category]
+                        del self.menu_data[category]
                     
-                    self.menu_data = updated_data
                     self.save_menu_data()
-                    self.update_menu_display()
+                    self._rebuild_menu()
                     
                     # Adjust current index
                     if self.current_index >= len(self.display_items) - 1:
@@ -1738,6 +2496,8 @@ class MenuMaker(App):
 
     def action_open_settings(self) -> None:
         """Open the settings screen for title, theme, and layout."""
+        if not self._data_loaded:
+            return  # Config still loading; an edit now would be overwritten
         def handle_settings_result(result: Optional[Dict[str, Any]]) -> None:
             if not result or result.get("action") != "apply":
                 return
@@ -1750,7 +2510,7 @@ class MenuMaker(App):
             theme_changed = new_theme != self.app_theme
             columns_changed = self.set_column_count(
                 new_columns,
-                apply_layout=not theme_changed,
+                apply_layout=False,
                 save_on_change=False
             )
             
@@ -1763,10 +2523,8 @@ class MenuMaker(App):
             if theme_changed:
                 self.app_theme = new_theme
                 self.apply_theme(new_theme)
-            else:
-                if columns_changed:
-                    self.update_menu_display()
-                    self.update_status()
+            if columns_changed:
+                self._apply_column_layout(reset_scroll=True)
             
             self.save_menu_data()
         
@@ -1777,231 +2535,34 @@ class MenuMaker(App):
     
     def apply_theme(self, theme_name: str) -> None:
         """Apply theme colors to the entire application."""
+        if theme_name == self._applied_theme and theme_name == self.app_theme:
+            return  # Already showing this theme; nothing to restyle or redraw
         theme_data = SettingsScreen.THEMES.get(theme_name, SettingsScreen.THEMES["classic"])
-        self.theme_colors = theme_data.copy()
-        
-        # Create dynamic CSS with theme colors AND responsive sizing
-        dynamic_css = f"""
-        Screen {{
-            background: {theme_data['bg']};
-        }}
-        
-        /* Responsive header - compact for small screens */
-        Header {{
-            background: {theme_data['primary']};
-            color: white;
-            text-align: center;
-            height: 1;
-            padding: 0;
-            margin: 0;
-        }}
-        
-        /* Compact footer for small screens */
-        Footer {{
-            background: {theme_data['primary']};
-            color: {theme_data['text']};
-            height: 1;
-            padding: 0;
-            margin: 0;
-        }}
-        
-        .main-container {{
-            height: 1fr;
-            border: none;
-            background: {theme_data['surface']};
-            padding: 0;
-            margin: 0;
-        }}
-        
-        /* Compact status bar */
-        .status-bar {{
-            dock: top;
-            height: 1;
-            background: {theme_data['primary']};
-            color: {theme_data['text']};
-            text-align: center;
-            padding: 0;
-            margin: 0;
-        }}
-        
-        /* Optimized menu container with minimal padding */
-        .menu-container {{
-            height: 1fr;
-            border: none;
-            background: {theme_data['surface']};
-            padding: 0;
-            margin: 0;
-            overflow-y: auto;
-        }}
-        
-        .columns-container {{
-            width: 100%;
-            height: 100%;
-            padding: 1 1;
-        }}
-        
-        .menu-column {{
-            width: 1fr;
-            min-width: 20;
-            padding-right: 1;
-        }}
-        
-        /* Compact category headers */
-        .category-header {{
-            height: 1;
-            padding: 0 1;
-            margin: 0;
-            background: {theme_data['surface']};
-            color: {theme_data['text']};
-            text-style: bold;
-            border: none;
-        }}
-        
-        .category-header.-selected {{
-            background: {theme_data['accent']};
-            color: {theme_data['bg']};
-        }}
-        
-        /* Compact menu items */
-        .menu-item {{
-            height: 1;
-            padding: 0 2;
-            margin: 0;
-            background: {theme_data['surface']};
-            color: {theme_data['text']};
-            border: none;
-        }}
-        
-        .menu-item.-selected {{
-            background: {theme_data['accent']};
-            color: {theme_data['bg']};
-            text-style: bold;
-        }}
-        
-        /* Responsive info container */
-        .info-container {{
-            align: center middle;
-            width: 90%;
-            max-width: 70;
-            height: auto;
-            background: {theme_data['surface']};
-            border: solid {theme_data['accent']};
-            padding: 1;
-        }}
-        
-        .info-title {{
-            text-align: center;
-            text-style: bold;
-            color: {theme_data['accent']};
-            margin-bottom: 0;
-        }}
-        
-        .info-field {{
-            color: {theme_data['text']};
-            margin-bottom: 0;
-        }}
-        
-        .info-description {{
-            color: {theme_data['text']};
-            text-style: italic;
-            margin-bottom: 0;
-        }}
-        
-        /* Responsive edit container */
-        .edit-container {{
-            align: left top;
-            width: 100%;
-            height: 100%;
-            background: {theme_data['surface']};
-            border: solid {theme_data['accent']};
-            padding: 1 2;
-        }}
-        
-        .edit-title {{
-            text-align: center;
-            text-style: bold;
-            color: {theme_data['accent']};
-            margin-bottom: 0;
-        }}
-        
-        /* Compact theme editor */
-        .theme-editor-container {{
-            width: 1fr;
-            height: 1fr;
-            background: {theme_data['surface']};
-            padding: 1;
-        }}
-        
-        .theme-editor-title {{
-            text-align: center;
-            text-style: bold;
-            color: {theme_data['accent']};
-            height: 1;
-        }}
-        
-        .theme-option {{
-            height: 2;
-            border: solid {theme_data['primary']};
-            margin-bottom: 0;
-            padding: 0 1;
-        }}
-        
-        /* Compact button row */
-        .button-row {{
-            align: center middle;
-            height: auto;
-            margin-top: 0;
-        }}
-        
-        .color-palette {{
-            height: 10;
-            overflow-y: auto;
-            border: solid {theme_data['accent']};
-            padding: 0 1;
-            margin-bottom: 1;
-        }}
-        
-        .color-button {{
-            height: auto;
-            text-align: left;
-            margin-bottom: 0;
-        }}
-        
-        .error-message {{
-            color: #ff6b6b;
-            height: 1;
-        }}
-        
-        Button {{
-            margin: 0;
-            padding: 0 1;
-        }}
-        """
+        self.theme_colors = theme_data
         
-        # Add unique identifier to CSS to force refresh
-        import time
-        css_id = f"theme_{theme_name}_{int(time.time())}"
-        dynamic_css = f"/* {css_id} */\n" + dynamic_css
-        
-        # Apply the dynamic CSS with force refresh
-        self.stylesheet.add_source(dynamic_css)
+        # Create dynamic CSS with theme colors AND responsive sizing, once per theme
+        dynamic_css = self._css_cache.get(theme_name)
+        if dynamic_css is None:
+            dynamic_css = self._css_cache[theme_name] = self._CSS_TEMPLATE.format_map(theme_data)
         
         # Set theme and save immediately
         self.app_theme = theme_name
         self.save_theme_data()
         
-        # Force complete visual refresh
-        self.refresh(layout=True)
-        self.update_menu_display()
-        self.update_highlighting()
-        self.update_status()
-        self.update_title()
+        # Replace the previous theme's CSS (one stable source), then restyle
+        # and relayout the mounted widgets in a single pass. Menu highlight
+        # and category colors are CSS classes, so nothing needs rebuilding.
+        self.stylesheet.add_source(dynamic_css, read_from=("", "menu-maker-theme"))
+        self.refresh_css(animate=False)
+        self._applied_theme = theme_name
         
-        # Final refresh to ensure all changes are visible
-        self.refresh()
+        # The status bar is the only text that shows the theme
+        self.update_status()
     
     def action_scan_bin_directory(self) -> None:
         """Scan ./bin directory and add executables as menu items."""
+        if not self._data_loaded:
+            return  # Config still loading; an edit now would be overwritten
         self.scan_and_add_bin_executables()
     
     def scan_and_add_bin_executables(self) -> None:
@@ -2015,24 +2576,25 @@ class MenuMaker(App):
         dest_bin_path = self.config_file.parent / "bin"
         dest_bin_path.mkdir(parents=True, exist_ok=True)
         
-        # Get existing commands to avoid duplicates
-        existing_commands = set()
-        existing_files = set()
-        for category_data in self.menu_data.values():
-            for item in category_data.get('items', []):
-                cmd = item.get('cmd', '').strip()
-                if cmd:
-                    existing_commands.add(cmd)
-                    # Extract filename from command path
-                    if cmd.startswith('~/.local/menu-maker/bin/'):
-                        existing_files.add(Path(cmd).name)
+        # Installed files, to avoid duplicates (has_command covers commands)
+        if self._item_index is None:
+            self._rebuild_item_index()
+        existing_files = self._bin_file_set
         
         # Scan for executable files
         new_executables = []
         try:
-            for file_path in source_bin_path.iterdir():
-                if file_path.is_file() and os.access(file_path, os.X_OK):
-                    filename = file_path.name
+            with os.scandir(source_bin_path) as entries:
+                for entry in entries:
+                    # One stat per entry gives both the file type and mode bits
+                    try:
+                        mode = entry.stat().st_mode
+                    except OSError:
+                        continue  # e.g. a dangling symlink
+                    if not stat.S_ISREG(mode) or not mode & 0o111:
+                        continue
+                    file_path = Path(entry.path)
+                    filename = entry.name
                     
                     # Skip if file already exists in destination
                     if filename in existing_files:
@@ -2043,15 +2605,21 @@ class MenuMaker(App):
                     new_cmd = f"~/.local/menu-maker/bin/{filename}"
                     
                     # Skip if command already exists
-                    if new_cmd in existing_commands:
+                    if self.has_command(new_cmd):
                         continue
                     
                     # Move file to destination directory
                     try:
-                        import shutil
-                        shutil.move(str(file_path), str(dest_file_path))
+                        try:
+                            # Same filesystem: a single rename
+                            os.rename(file_path, dest_file_path)
+                        except OSError as e:
+                            if e.errno != errno.EXDEV:
+                                raise
+                            shutil.move(str(file_path), str(dest_file_path))
                         # Ensure executable permissions are preserved
-                        dest_file_path.chmod(0o755)
+                        if mode & 0o777 != 0o755:
+                            os.chmod(dest_file_path, 0o755)
                     except Exception:
                         continue  # Skip files that can't be moved
                     
@@ -2068,25 +2636,15 @@ class MenuMaker(App):
         except Exception:
             return  # Silent handling of scan errors
         
-        # Add new executables to menu
+        # Add new executables to the "Bin Executables" category in one go
         if new_executables:
-            # Ensure "Bin Executables" category exists
-            if "Bin Executables" not in self.menu_data:
-                updated_data = dict(self.menu_data)
-                updated_data["Bin Executables"] = {
-                    "expanded": True,
-                    "items": []
-                }
-                self.menu_data = updated_data
-            
-            # Add new items to the category
-            for new_item in new_executables:
-                self.add_new_item(new_item)
+            self._add_items_bulk(new_executables)
     
     async def action_exit_app(self) -> None:
         """Exit the application."""
-        # Save current theme before exiting
+        # Save current theme and any pending menu changes before exiting
         self.save_theme_data()
+        self.flush_menu_save()
         self.exit()
 
 